@@ -23,29 +23,64 @@ from attrs import define, field
 
 _sys_path.append(str(Path(__file__).parent.joinpath("PyManifold")))
 
-from .caching import parallel  # noqa: E402
+from .caching import evaluation_scope, memoize_value, parallel  # noqa: E402
 from .consts import AnyResolution, Outcome, T  # noqa: E402
 from .util import DictDeserializable  # noqa: E402
 
 if TYPE_CHECKING:  # pragma: no cover
     from logging import Logger
-    from typing import Any
+    from typing import Any, Callable, ClassVar, Optional
 
     from .consts import OutcomeType
 
 
+def _as_is(ret: float) -> float:
+    return ret
+
+
+def _mc_from_mapping(ret: Mapping[Any, float]) -> dict[int, float]:
+    return {int(val): share for val, share in ret.items()}
+
+
+def _mc_from_single(ret: int | str) -> dict[int, float]:
+    return {int(ret): 1}
+
+
+def _mc_from_iterable(ret: Iterable[int | str]) -> dict[int, float]:
+    return {int(val): 1 for val in ret}
+
+
+# Exact-type lookups for the values rules usually return, so the common cases skip the isinstance() ladders in
+# Rule.value(). Anything else, including subclasses of these, falls through to those ladders.
+_BINARY_FAST_PATHS: dict[type, Callable[[Any], float]] = {int: _as_is, float: _as_is, str: float}
+_MC_FAST_PATHS: dict[type, Callable[[Any], dict[int, float]]] = {
+    dict: _mc_from_mapping,
+    int: _mc_from_single,
+    str: _mc_from_single,
+    list: _mc_from_iterable,
+    tuple: _mc_from_iterable,
+    set: _mc_from_iterable,
+}
+
+
 @define(slots=False)  # type: ignore
 class Rule(ABC, Generic[T], DictDeserializable):
     """The basic unit of market automation, rules defmine how a market should react to given events."""
 
     tags_used: set[str] = field(factory=set, init=False, repr=False, hash=False)
-    logger: Logger = field(init=False, repr=False, hash=False)
+    logger: ClassVar[Logger] = getLogger(__name__)
+    _cost: ClassVar[int] = 1
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Let each subclass's `_value` reuse results within an evaluation scope."""
+        super().__init_subclass__(**kwargs)
+        if '_value' in cls.__dict__:
+            cls._value = memoize_value(cls.__dict__['_value'])  # type: ignore[assignment]
 
     def __attrs_post_init__(self) -> None:
-        """Ensure that the logger object is created."""
+        """Give subclasses one place to build derived state, both after __init__ and after unpickling."""
         if hasattr(super(), '__attrs_post_init__'):
             super().__attrs_post_init__()  # type: ignore
-        self.logger = getLogger(f"{type(self).__qualname__}[{id(self)}]")
 
     @abstractmethod
     def _value(
@@ -54,33 +89,60 @@ class Rule(ABC, Generic[T], DictDeserializable):
     ) -> T:  # pragma: no cover
         ...
 
+    def cost(self) -> int:
+        """Return a rough estimate of how expensive this rule is to evaluate, relative to a local computation.
+
+        Rules that make network requests report a much higher cost, so that combinators can try cheaper rules first. The
+        estimate for a combinator covers its whole subtree, so it is worked out once and then kept.
+        """
+        ret: Optional[int] = self.__dict__.get('_subtree_cost')
+        if ret is None:
+            ret = self.__dict__['_subtree_cost'] = self._estimate_cost()
+        return ret
+
+    def _estimate_cost(self) -> int:
+        """Work out the value cost() reports. Combinators override this to add up their children."""
+        return self._cost
+
     def __getstate__(self) -> Mapping[str, Any]:
         """Remove sensitive/non-serializable state before dumping to database."""
         state = self.__dict__.copy()
         if 'tags_used' in state:
             del state['tags_used']
-        if 'logger' in state:
-            del state['logger']
+        if '_subtree_cost' in state:
+            del state['_subtree_cost']
         return state
 
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        """Rebuild non-serializable and derived state after retrieving from database."""
+        self.__dict__.update(state)
+        self.tags_used = set()
+        self.__attrs_post_init__()
+
     def value(
         self,
         market: Market,
         format: Literal['NONE'] | OutcomeType = 'NONE',
         refresh: bool = False
     ) -> AnyResolution:
-        """Return the resolution value of a market, appropriately formatted for its market type."""
-        ret = self._value(market)
+        """Return the resolution value of a market, appropriately formatted for its market type.
+
+        Rules shared between several branches of the tree below this one are only evaluated once.
+        """
+        with evaluation_scope():
+            ret = self._value(market)
         if (ret is None) or (ret == "CANCEL") or (format == 'NONE'):
             return cast(AnyResolution, ret)
-        elif format in Outcome.BINARY_LIKE():
-            return self.__binary_value(market, ret)
-        elif format in Outcome.MC_LIKE():
-            return self.__multiple_choice_value(market, ret)
-        raise ValueError()
+        formatter = self.__formatters.get(format)
+        if formatter is None:
+            raise ValueError()
+        return formatter(self, market, ret)
 
     def __binary_value(self, market: Market, ret: Any) -> float:
-        if not isinstance(ret, str) and isinstance(ret, Sequence):
+        fast_path = _BINARY_FAST_PATHS.get(type(ret))
+        if fast_path is not None:
+            return fast_path(ret)
+        elif not isinstance(ret, str) and isinstance(ret, Sequence):
             (ret, ) = ret
         elif isinstance(ret, Mapping) and len(ret) == 1:
             ret = cast(Union[str, int, float], next(iter(ret.items()))[0])
@@ -93,7 +155,10 @@ class Rule(ABC, Generic[T], DictDeserializable):
         raise TypeError(ret, format, market)
 
     def __multiple_choice_value(self, market: Market, ret: Any) -> Mapping[int, float]:
-        if isinstance(ret, Mapping):
+        fast_path = _MC_FAST_PATHS.get(type(ret))
+        if fast_path is not None:
+            ret = fast_path(ret)
+        elif isinstance(ret, Mapping):
             ret = {int(val): share for val, share in ret.items()}
         elif isinstance(ret, (int, str)):
             ret = {int(ret): 1}
@@ -105,6 +170,12 @@ class Rule(ABC, Generic[T], DictDeserializable):
             raise TypeError(ret, format, market)
         return normalize_mapping(ret)
 
+    # which formatter value() uses for each market type, built once rather than tested for on every call
+    __formatters: ClassVar[dict[str, Callable[[Rule[Any], Market, Any], AnyResolution]]] = {
+        **dict.fromkeys(Outcome.BINARY_LIKE(), __binary_value),
+        **dict.fromkeys(Outcome.MC_LIKE(), __multiple_choice_value),
+    }
+
     @abstractmethod
     def _explain_abstract(self, indent: int = 0, **kwargs: Any) -> str:  # pragma: no cover
         raise NotImplementedError(type(self))
@@ -114,8 +185,12 @@ class Rule(ABC, Generic[T], DictDeserializable):
         return self._explain_abstract(indent, **kwargs)
 
     def explain_specific(self, market: Market, indent: int = 0, sig_figs: int = 4) -> str:
-        """Explain why the market is resolving the way that it is."""
-        return self._explain_specific(market, indent, sig_figs)
+        """Explain why the market is resolving the way that it is.
+
+        Each rule in the tree is evaluated once, however many lines of the explanation mention its value.
+        """
+        with evaluation_scope():
+            return self._explain_specific(market, indent, sig_figs)
 
     def _explain_specific(self, market: Market, indent: int = 0, sig_figs: int = 4) -> str:
         f_val = parallel(self._value, market)
@@ -185,8 +260,8 @@ if getenv("DEBUG"):  # pragma: no cover
     sys.excepthook = info
 
 # dynamically load optional plugins where able to
-exempt = {
+exempt = frozenset({
     '__init__', '__main__', '__pycache__', 'application', 'test', 'PyManifold', 'py.typed', 'http_cache.sqlite',
     *__all__
-}
+})
 dynamic_import(__file__, __name__, __all__, exempt)
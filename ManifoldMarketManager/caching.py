@@ -2,6 +2,10 @@
 from __future__ import annotations
 
 from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import as_completed as _as_completed
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import wraps
 from os import getenv
 from sys import version_info
 from typing import TYPE_CHECKING, Generic, TypeVar, cast
@@ -9,36 +13,45 @@ from typing import TYPE_CHECKING, Generic, TypeVar, cast
 import requests_cache
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Callable, Optional
+    from typing import Any, Callable, Iterable, Iterator, Optional
 
 T = TypeVar("T")
 
+#: results of Rule._value calls in the current evaluation_scope(), or None outside of one
+_memo: ContextVar[Optional[dict[Any, Any]]] = ContextVar("ManifoldMarketManager_memo", default=None)
+
 CACHE = not getenv("ManifoldMarketManager_NO_CACHE")
 if CACHE:
     requests_cache.install_cache(expire_after=360, allowable_methods=('GET', ))
     executor = ThreadPoolExecutor(thread_name_prefix="ManifoldMarketManagerWorker_")
-else:
-    if version_info >= (3, 9):  # I hate this
-        _Future = Future
-    else:
-        class _Future(Future, Generic[T]):  # type: ignore
-            def result(self, timeout: Optional[float] = None) -> T:
-                return cast(T, super().result(timeout))
-
-    class Deferred(_Future[T]):
-        """Dummy future class for use in testing."""
-
-        def __init__(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> None:
-            """Store func and arguments."""
-            self.deferred_func = func
-            self.args = args
-            self.kwargs = kwargs
-            super().__init__()
 
+if version_info >= (3, 9):  # I hate this
+    _Future = Future
+else:
+    class _Future(Future, Generic[T]):  # type: ignore
         def result(self, timeout: Optional[float] = None) -> T:
-            """Execute the deferred function and return its value."""
+            return cast(T, super().result(timeout))
+
+
+class Deferred(_Future[T]):
+    """Future which runs its function in the calling thread, the first time its result is requested.
+
+    This is used for work too cheap to be worth a trip through the thread pool, and for everything when caching is
+    disabled in testing.
+    """
+
+    def __init__(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> None:
+        """Store func and arguments."""
+        self.deferred_func = func
+        self.args = args
+        self.kwargs = kwargs
+        super().__init__()
+
+    def result(self, timeout: Optional[float] = None) -> T:
+        """Execute the deferred function, if that hasn't happened yet, and return its value."""
+        if not self.done():
             self.set_result(self.deferred_func(*self.args, **self.kwargs))
-            return super().result(timeout)
+        return super().result(timeout)
 
 
 def parallel(func: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
@@ -47,8 +60,65 @@ def parallel(func: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
     I need to be able to disable the cache/parallel launching or VCR doesn't work on testing.
     """
     if CACHE:
+        # run in a copy of the caller's context, so that workers share its evaluation_scope()
+        context = copy_context()
+
         def wrapped() -> T:
-            return func(*args, **kwargs)
+            return context.run(func, *args, **kwargs)
 
         return executor.submit(wrapped)
     return Deferred(func, *args, **kwargs)
+
+
+@contextmanager
+def evaluation_scope() -> Iterator[None]:
+    """Within this block, evaluate each rule at most once per market, reusing the first result.
+
+    Scopes nest, with inner scopes sharing the outermost one's results. Tasks launched with parallel() from inside a
+    scope share it as well.
+    """
+    if _memo.get() is not None:
+        yield
+        return
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def memoize_value(func: Callable[[Any, Any], T]) -> Callable[[Any, Any], T]:
+    """Wrap a Rule._value implementation so that it consults the current evaluation_scope(), if any."""
+    @wraps(func)
+    def wrapped(self: Any, market: Any) -> T:
+        memo = _memo.get()
+        if memo is None:
+            return func(self, market)
+        key = (func, id(self), id(market))
+        if key in memo:
+            return cast(T, memo[key])
+        ret = memo[key] = func(self, market)
+        return ret
+
+    return wrapped
+
+
+def as_completed(futures: Iterable[Future[T]]) -> Iterator[Future[T]]:
+    """Yield futures as they finish, like `concurrent.futures.as_completed`, but safe to use with Deferred objects.
+
+    A Deferred only runs once its result is requested, so waiting on one would block forever. Instead they are
+    yielded first, so the caller runs them while any tasks in the thread pool are still going.
+    """
+    pooled = []
+    for future in futures:
+        if isinstance(future, Deferred):
+            yield future
+        else:
+            pooled.append(future)
+    yield from _as_completed(pooled)
+
+
+def cancel_all(futures: Iterable[Future[Any]]) -> None:
+    """Cancel every future that has not started yet, for when their results are no longer needed."""
+    for future in futures:
+        future.cancel()
@@ -32,6 +32,8 @@ AVAILABLE_RULES = [
     "generic.ResolveToValue",
     "generic.AdditiveRule",
     "generic.MultiplicitiveRule",
+    "generic.AnyRule",
+    "generic.AllRule",
     "generic.ModulusRule",
     "generic.ResolveRandomSeed",
     "generic.ResolveRandomIndex",
@@ -88,16 +90,18 @@ class Outcome(str, Enum):  # officially supported in python3.11+
     @staticmethod
     def BINARY_LIKE() -> Sequence[OutcomeType]:
         """Return the group of markets that resolves using the binary market API."""
-        return (Outcome.BINARY, Outcome.PSEUDO_NUMERIC)
+        return _BINARY_LIKE
 
     @staticmethod
     def MC_LIKE() -> Sequence[OutcomeType]:
         """Return the group of markets that resolves using the free response market API."""
-        return (Outcome.FREE_RESPONSE, Outcome.MULTIPLE_CHOICE)
+        return _MC_LIKE
 
 
 OutcomeType = Union[Outcome, Literal["BINARY", "FREE_RESPONSE", "PSEUDO_NUMERIC", "MULTIPLE_CHOICE"]]
 OUTCOMES: Sequence[OutcomeType] = ("BINARY", "FREE_RESPONSE", "PSEUDO_NUMERIC", "MULTIPLE_CHOICE")
+_BINARY_LIKE: Sequence[OutcomeType] = (Outcome.BINARY, Outcome.PSEUDO_NUMERIC)
+_MC_LIKE: Sequence[OutcomeType] = (Outcome.FREE_RESPONSE, Outcome.MULTIPLE_CHOICE)
 
 FieldType = Literal["allTime", "daily", "weekly", "monthly"]
 FIELDS: Sequence[FieldType] = ("allTime", "daily", "weekly", "monthly")
@@ -7,20 +7,19 @@ from dataclasses import dataclass, field
 from logging import getLogger
 from threading import Lock
 from time import time
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Mapping, cast
 
 from pyee import EventEmitter
 from pyee.cls import evented
 
 from .account import Account
-from .caching import parallel
+from .caching import cancel_all, evaluation_scope, parallel
 from .consts import EnvironmentVariable, MarketStatus, Outcome
 from .rule import get_rule
 from .util import DictDeserializable, explain_abstract, get_client, require_env, round_sig_figs
 
 if TYPE_CHECKING:  # pragma: no cover
-    from logging import Logger
-    from typing import Any, Mapping, Optional, Sequence
+    from typing import Any, Iterable, Optional, Sequence
 
     from pymanifold.lib import ManifoldClient
     from pymanifold.types import Market as APIMarket
@@ -30,6 +29,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from .consts import AnyResolution
     from .util import ModJSONDict
 
+logger = getLogger(__name__)
+
 
 @evented
 @dataclass
@@ -61,7 +62,6 @@ class Market(DictDeserializable):
     account: Account = field(default_factory=Account.from_env)
     do_resolve_rules: list[Rule[Optional[bool]]] = field(default_factory=list)
     resolve_to_rules: list[Rule[AnyResolution]] = field(default_factory=list)
-    logger: Logger = field(init=False, default=None, hash=False, repr=False)  # type: ignore[assignment]
     event_emitter: EventEmitter = field(init=False, default_factory=EventEmitter, hash=False, repr=False)
 
     def __hash__(self) -> int:
@@ -80,15 +80,12 @@ class Market(DictDeserializable):
         self.client = get_client(self.account)
         if self._after_resolve not in self.event_emitter.listeners('after_resolve'):
             self.event_emitter.add_listener('after_resolve', self._after_resolve)
-        self.logger = getLogger(f"{type(self).__qualname__}[{id(self)}]")
 
     def __getstate__(self) -> Mapping[str, Any]:
         """Remove sensitive/non-serializable state before dumping to database."""
         state = self.__dict__.copy()
         del state['client']
         del state['account']
-        if 'logger' in state:
-            del state['logger']
         state['event_emitter'] = copy(state['event_emitter'])
         del state['event_emitter']._lock
         assert self.event_emitter._lock
@@ -115,9 +112,11 @@ class Market(DictDeserializable):
     @property
     def status(self) -> MarketStatus:
         """Return whether a market is OPEN, CLOSED, or RESOLVED."""
-        if self.market.isResolved:
+        market = self.market
+        if market.isResolved:
             return MarketStatus.RESOLVED
-        elif self.market.closeTime and self.market.closeTime < time() * 1000:
+        close_time = market.closeTime
+        if close_time and close_time < time() * 1000:
             return MarketStatus.CLOSED
         return MarketStatus.OPEN
 
@@ -139,6 +138,16 @@ class Market(DictDeserializable):
         api_market = get_client().get_market_by_id(id)
         return cls(api_market, *args, **kwargs)
 
+    @classmethod
+    def from_ids(cls, ids: Iterable[str]) -> list[Market]:
+        """Reconstruct many Market objects from their IDs, fetching them concurrently.
+
+        No rules are attached, since sharing one set of rule objects between markets would make them alias.
+        """
+        client = get_client()
+        futures = [parallel(client.get_market_by_id, id_) for id_ in ids]
+        return [cls(future.result()) for future in futures]
+
     @classmethod
     def from_dict(cls, env: ModJSONDict) -> Market:
         """Take a dictionary and return an instance of the associated class."""
@@ -167,12 +176,22 @@ class Market(DictDeserializable):
         return explain_abstract(**kwargs)
 
     def explain_specific(self, sig_figs: int = 4) -> str:
-        """Explain why the market is resolving the way that it is."""
+        """Explain why the market is resolving the way that it is.
+
+        Rules are evaluated once for the whole explanation, so every line agrees with the final value shown.
+        """
+        with evaluation_scope():
+            return self.__explain_specific(sig_figs)
+
+    def __explain_specific(self, sig_figs: int) -> str:
         shim = ""
         rule_: Rule[Any]
+        futures = [parallel(rule_.value, self) for rule_ in (self.do_resolve_rules or ())]
         for rule_ in self.do_resolve_rules:
             shim += rule_.explain_specific(market=self, indent=1, sig_figs=sig_figs)
-        if not (self.market.isResolved or self.should_resolve()):
+        # evaluate each trigger only once, rather than again through should_resolve()
+        triggered = any(future.result() for future in futures)
+        if not (self.market.isResolved or triggered):
             ret = (f"This market is not resolving, because none of the following are true:\n{shim}\nWere it to "
                    "resolve now, it would follow the decision tree below:\n")
         else:
@@ -201,19 +220,23 @@ class Market(DictDeserializable):
         elif self.market.outcomeType in Outcome.MC_LIKE():
             assert not isinstance(val, (float, str))
             ret = "{"
-            total = sum(val.values())
+            scale = 100 / sum(val.values())
             for idx, (key, weight) in enumerate(val.items()):
                 ret += ", " * bool(idx)
-                ret += f"{key}: {round_sig_figs(weight * 100 / total, sig_figs)}%"
+                ret += f"{key}: {round_sig_figs(weight * scale, sig_figs)}%"
             ret += "}"
         else:
             ret = str(val)
         return ret
 
     def should_resolve(self) -> bool:
-        """Return whether the market should resolve, according to our rules."""
-        futures = [parallel(rule.value, self) for rule in (self.do_resolve_rules or ())]
-        return any(future.result() for future in futures) and not self.market.isResolved
+        """Return whether the market should resolve, according to our rules.
+
+        A rule shared between several triggers is only evaluated once.
+        """
+        with evaluation_scope():
+            futures = [parallel(rule.value, self) for rule in (self.do_resolve_rules or ())]
+            return any(future.result() for future in futures) and not self.market.isResolved
 
     def resolve_to(self) -> AnyResolution:
         """Select a value to be resolved to.
@@ -226,16 +249,23 @@ class Market(DictDeserializable):
         Free response markets must resolve to either a single index integer or
          a mapping of indices to weights.
         Any rule may return "CANCEL" to instead refund all orders.
+
+        A rule shared between several of these is only evaluated once.
         """
         assert self.market.outcomeType != "NUMERIC"
         chosen = None
-        futures = [parallel(rule.value, self, format=self.market.outcomeType) for rule in (self.resolve_to_rules or ())]
-        for f_rule in futures:
-            chosen = f_rule.result()
-            if chosen is not None:
-                break
+        with evaluation_scope():
+            futures = [
+                parallel(rule.value, self, format=self.market.outcomeType) for rule in (self.resolve_to_rules or ())
+            ]
+            for idx, f_rule in enumerate(futures):
+                chosen = f_rule.result()
+                if chosen is not None:
+                    # later rules can no longer change the answer, so don't let them occupy the pool
+                    cancel_all(futures[idx + 1:])
+                    break
         if chosen is None:
-            raise RuntimeError()
+            raise RuntimeError("No resolution rule produced a value", self)
         return chosen
 
     def current_answer(self) -> AnyResolution:
@@ -264,12 +294,14 @@ class Market(DictDeserializable):
         if self.market.outcomeType in Outcome.MC_LIKE():
             if not isinstance(_override, Mapping):
                 raise TypeError()
-            _override = {int(id_): weight for id_, weight in _override.items()}
+            # rules usually hand back int-keyed mappings already, so only rebuild when needed
+            if not all(type(id_) is int for id_ in _override):
+                _override = {int(id_): weight for id_, weight in _override.items()}
 
         self.event_emitter.emit('before_resolve', self, _override)
         ret: Response = self.client.resolve_market(self.market, _override)
         ret.raise_for_status()
-        self.logger.info("I was resolved")
+        logger.info("Market %s was resolved", self.id)
         self.market.isResolved = True
         self.event_emitter.emit('after_resolve', self, _override, ret)
         return ret
@@ -285,7 +317,7 @@ class Market(DictDeserializable):
         """
         ret: Response = self.client.cancel_market(self.market)
         ret.raise_for_status()
-        self.logger.info("I was cancelled")
+        logger.info("Market %s was cancelled", self.id)
         self.market.isResolved = True
         return ret
 
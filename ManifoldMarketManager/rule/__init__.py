@@ -6,22 +6,31 @@ a rule with your plugin:
    `from sys import modules; modules['.'.join((PATH_TO_RULE_MODULE, PATH_TO_YOUR_RULE))] = module[PATH_TO_YOUR_RULE]
 2) Append your plugin's namespace to `rule.__all__`
 3) Append each of your rules' import paths to `consts.AVAILABLE_RULES`
+4) If you replace a rule that may already have been looked up, call `get_rule.cache_clear()`
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
-from typing import Any, Optional, Type, cast
+from pathlib import Path
+from traceback import print_exc
+from types import ModuleType
+from typing import Any, Optional, Type, Union, cast
+from warnings import warn
 
 from attrs import define
 
 from .. import Rule
 from ..consts import AnyResolution
-from ..util import dynamic_import
 
 
+@lru_cache(maxsize=None)
 def get_rule(type_: str) -> Type[Rule[Any]]:
-    """Dynamically import and return a rule type by name."""
+    """Dynamically import and return a rule type by name.
+
+    Lookups are cached, since deserializing a rule tree looks up the same few names once per node.
+    """
     ret = getattr(
         import_module(".".join(("", *type_.split(".")[:-1])), __name__),
         type_.split(".")[-1]
@@ -41,8 +50,49 @@ class ResolutionValueRule(Rule[AnyResolution]):
     """The subtype of rule which determines what a market should resolve to."""
 
 
-__all__ = ['get_rule', 'DoResolveRule', 'ResolutionValueRule']
+_core_names = ['get_rule', 'DoResolveRule', 'ResolutionValueRule']
+
+# optional plugins are found up front, but only imported the first time they are used
+exempt = frozenset({'__init__', '__main__', '__pycache__'})
+_plugin_names = frozenset(
+    entry.name if entry.is_dir() else entry.stem
+    for entry in Path(__file__).parent.glob("[!.]*")
+    if entry.is_dir() or entry.suffix == ".py"
+) - exempt
+_unavailable: set[str] = set()
+
+
+def _load_plugin(name: str) -> Optional[ModuleType]:
+    """Import a plugin submodule, warning and returning None if its optional dependencies are missing."""
+    if name in _unavailable:
+        return None
+    try:
+        module = import_module("." + name, __name__)
+    except ImportError:
+        print_exc()
+        warn(f"Unable to import extension module: {__name__}.{name}")
+        _unavailable.add(name)
+        return None
+    globals()[name] = module
+    return module
+
+
+def __getattr__(name: str) -> Union[ModuleType, list[str]]:
+    """Import a plugin submodule on first access.
+
+    `__all__` is also built here, so that it only lists the plugins that can actually be imported.
+    """
+    if name == '__all__':
+        ret = _core_names + [plugin for plugin in sorted(_plugin_names) if _load_plugin(plugin) is not None]
+        globals()['__all__'] = ret
+        return ret
+    if name in _plugin_names:
+        module = _load_plugin(name)
+        if module is not None:
+            return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-# dynamically load optional plugins where able to
-exempt = {'__init__', '__main__', '__pycache__'}
-dynamic_import(__file__, __name__, __all__, exempt)
+def __dir__() -> list[str]:
+    """List this module's attributes, including plugins that have not been imported yet."""
+    return sorted({*globals(), *(_plugin_names - _unavailable)})
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from os import urandom
 from random import Random
 from typing import TYPE_CHECKING, Generic, cast
@@ -14,7 +15,7 @@ from ..util import round_sig_figs
 from . import ResolutionValueRule, get_rule
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, ClassVar, Sequence
+    from typing import Any, ClassVar, Mapping, Sequence
 
     from pymanifold.types import JSONDict
 
@@ -24,6 +25,12 @@ if TYPE_CHECKING:  # pragma: no cover
 SENTINEL_STUB = "A programatic explanation was not provided"
 
 
+@lru_cache(maxsize=128, typed=True)
+def _seeded_state(seed: int | float | str | bytes) -> tuple[Any, ...]:
+    """Return the state of a Random object freshly seeded with `seed`."""
+    return Random(seed).getstate()
+
+
 @define(slots=False)  # type: ignore
 class AbstractRule(Generic[T], Rule[T]):
     """Provide a rule where the explanations are pre-generated."""
@@ -49,6 +56,10 @@ class UnaryRule(AbstractRule[T]):
 
     child: Rule[T]
 
+    def _estimate_cost(self) -> int:
+        """Return the estimated cost of evaluating the child."""
+        return self.child.cost()
+
     def _explain_abstract(self, indent: int = 0, **kwargs: Any) -> str:
         return super()._explain_abstract(indent, **kwargs) + self.child.explain_abstract(indent + 1, **kwargs)
 
@@ -72,6 +83,21 @@ class BinaryRule(AbstractRule[T]):
 
     rule1: Rule[T]
     rule2: Rule[T]
+    _commutative: ClassVar[bool] = False
+
+    def _evaluation_order(self) -> tuple[Rule[T], Rule[T]]:
+        """Return our children in the order they should be evaluated.
+
+        If the order doesn't matter, the cheaper one goes first to make short-circuiting pay off. The children
+        themselves are left as written, so explanations still match what the user wrote.
+        """
+        if self._commutative and self.rule2.cost() < self.rule1.cost():
+            return self.rule2, self.rule1
+        return self.rule1, self.rule2
+
+    def _estimate_cost(self) -> int:
+        """Return the estimated cost of evaluating both children."""
+        return self.rule1.cost() + self.rule2.cost()
 
     @classmethod
     def from_dict(cls, env: ModJSONDict) -> 'BinaryRule[T]':
@@ -101,6 +127,17 @@ class VariadicRule(AbstractRule[T]):
     """Perform a variadic operation on many Rules."""
 
     rules: list[Rule[T]] = Factory(list)
+    _commutative: ClassVar[bool] = False
+
+    def _estimate_cost(self) -> int:
+        """Return the estimated cost of evaluating every child."""
+        return sum(rule.cost() for rule in self.rules)
+
+    def _evaluation_order(self) -> list[Rule[T]]:
+        """Return our children in the order they should be evaluated, cheapest first if the order doesn't matter."""
+        if self._commutative:
+            return sorted(self.rules, key=lambda rule: rule.cost())
+        return self.rules
 
     @classmethod
     def from_dict(cls, env: ModJSONDict) -> 'VariadicRule[T]':
@@ -138,8 +175,20 @@ class ResolveRandomSeed(ResolutionValueRule):
     kwargs: JSONDict = Factory(dict)
 
     def _value(self, market: Market) -> Any:
-        source = Random(self.seed)
+        return self._draw(self.args, self.kwargs)
+
+    def _draw(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> Any:
+        """Call `method` `rounds` times on a generator freshly seeded with `seed`, and return the last result."""
+        seed = self.seed
+        # a fresh generator per call keeps this deterministic and thread-safe, but restoring a cached state is cheaper
+        # than hashing the seed again
+        source = Random.__new__(Random)
+        source.setstate(_seeded_state(bytes(seed) if isinstance(seed, bytearray) else seed))
         method = getattr(source, self.method)
+        if self.method == 'random' and self.rounds > 1:
+            # each random() call consumes exactly 64 bits of state, so skipping ahead in one call is equivalent
+            source.getrandbits(64 * (self.rounds - 1))
+            return method(*args, **kwargs)
         for _ in range(self.rounds):
-            ret = method(*self.args, **self.kwargs)
+            ret = method(*args, **kwargs)
         return ret
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Dict, Generic, Mapping, Optional, Tuple, Union, cast
+from datetime import datetime
+from itertools import accumulate
+from time import time
+from typing import TYPE_CHECKING, Generic, Mapping, Optional, Union, cast
 
-from attrs import Factory, define
+from attrs import Factory, define, evolve
 
 from .. import Rule
-from ..caching import parallel
+from ..caching import Deferred, as_completed, cancel_all, parallel
 from ..consts import BinaryResolution, PseudoNumericResolution, T
 from ..util import normalize_mapping
 from . import DoResolveRule, ResolutionValueRule, get_rule
@@ -17,12 +18,23 @@ from .abstract import BinaryRule, ResolveRandomSeed, UnaryRule, VariadicRule
 
 if TYPE_CHECKING:  # pragma: no cover
     from concurrent.futures import Future
-    from typing import Any, ClassVar, DefaultDict, Literal, MutableSequence
+    from typing import Any, ClassVar, Literal, MutableSequence, Sequence
 
     from ..consts import FreeResponseResolution, MultipleChoiceResolution
     from ..market import Market
     from ..util import ModJSONDict
 
+#: Rules estimated to cost less than this are evaluated in the calling thread, since handing them to the thread pool
+#: would cost more than the work itself. See Rule.cost()
+INLINE_COST = 10
+
+
+def _launch(rule: Rule[Any], market: Market, **kwargs: Any) -> Future[Any]:
+    """Start evaluating a child rule, sending it to the thread pool only if it is expensive."""
+    if rule.cost() < INLINE_COST:
+        return Deferred(rule.value, market, **kwargs)
+    return parallel(rule.value, market, **kwargs)
+
 
 @define(slots=False)
 class NegateRule(UnaryRule[Optional[BinaryResolution]]):
@@ -39,9 +51,11 @@ class EitherRule(BinaryRule[Optional[BinaryResolution]]):
     """Return the OR of two other DoResolveRules."""
 
     _explainer_stub: ClassVar[str] = "Resolve True if either of the below resolves True, otherwise resolve False"
+    _commutative: ClassVar[bool] = True
 
     def _value(self, market: Market) -> bool:
-        return bool(self.rule1._value(market)) or bool(self.rule2._value(market))
+        first, second = self._evaluation_order()
+        return bool(first._value(market) or second._value(market))
 
 
 @define(slots=False)
@@ -49,9 +63,11 @@ class BothRule(BinaryRule[Optional[BinaryResolution]]):
     """Return the AND of two other DoResolveRules."""
 
     _explainer_stub: ClassVar[str] = "Resolve True if both of the below resolve to True, otherwise resolve False"
+    _commutative: ClassVar[bool] = True
 
     def _value(self, market: Market) -> bool:
-        return bool(self.rule1._value(market)) and bool(self.rule2._value(market))
+        first, second = self._evaluation_order()
+        return bool(first._value(market) and second._value(market))
 
 
 @define(slots=False)
@@ -59,9 +75,11 @@ class NANDRule(BinaryRule[Optional[BinaryResolution]]):
     """Return the NAND of two other DoResolveRules."""
 
     _explainer_stub: ClassVar[str] = "Resolve True if one or more of the below resolves False, otherwise resolve False"
+    _commutative: ClassVar[bool] = True
 
     def _value(self, market: Market) -> bool:
-        return not (self.rule1._value(market) and self.rule2._value(market))
+        first, second = self._evaluation_order()
+        return not (first._value(market) and second._value(market))
 
 
 @define(slots=False)
@@ -69,9 +87,11 @@ class NeitherRule(BinaryRule[Optional[BinaryResolution]]):
     """Return the NOR of two other DoResolveRules."""
 
     _explainer_stub: ClassVar[str] = "Resolve False if either of the below resolve to True, otherwise resolve True"
+    _commutative: ClassVar[bool] = True
 
     def _value(self, market: Market) -> bool:
-        return not (self.rule1._value(market) or self.rule2._value(market))
+        first, second = self._evaluation_order()
+        return not (first._value(market) or second._value(market))
 
 
 @define(slots=False)
@@ -81,7 +101,7 @@ class XORRule(BinaryRule[Optional[BinaryResolution]]):
     _explainer_stub: ClassVar[str] = "Resolve False if the below resolve to the same value, otherwise resolve True"
 
     def _value(self, market: Market) -> bool:
-        return bool(bool(self.rule1._value(market)) ^ bool(self.rule2._value(market)))
+        return bool(self.rule1._value(market)) != bool(self.rule2._value(market))
 
 
 @define(slots=False)
@@ -115,9 +135,15 @@ class ConditionalRule(BinaryRule[BinaryResolution]):
     )
 
     def _value(self, market: Market) -> BinaryResolution:
+        if self.rule1.cost() < INLINE_COST:
+            # nothing to overlap with a cheap premise, so check it first and skip the value entirely if it fails
+            if not self.rule1._value(market):
+                return "CANCEL"
+            return self.rule2._value(market)
         f_val1 = parallel(self.rule1._value, market)
         f_val2 = parallel(self.rule2._value, market)
         if not f_val1.result():
+            f_val2.cancel()
             return "CANCEL"
         return f_val2.result()
 
@@ -128,12 +154,18 @@ class ResolveAtTime(DoResolveRule):
 
     resolve_at: datetime
 
+    def __attrs_post_init__(self) -> None:
+        """Precompute the POSIX timestamp to compare against, treating naive datetimes as local time."""
+        super().__attrs_post_init__()
+        self._resolve_epoch = self.resolve_at.timestamp()
+        self._passed = False
+
     def _value(self, market: Market) -> bool:
         """Return True iff the current time is after resolve_at."""
-        try:
-            return datetime.now(timezone.utc) >= self.resolve_at
-        except TypeError:
-            return datetime.now() >= self.resolve_at
+        # once the time has passed it stays passed, so stop asking the clock
+        if not self._passed:
+            self._passed = time() >= self._resolve_epoch
+        return self._passed
 
     def _explain_abstract(self, indent: int = 0, **kwargs: Any) -> str:
         return f"{'  ' * indent}- Resolve True if the current time is past {self.resolve_at}, otherwise resolve False\n"
@@ -173,16 +205,15 @@ class AdditiveRule(VariadicRule[PseudoNumericResolution]):
 
     def _value(self, market: Market) -> Literal["CANCEL"] | float:
         """Return the sum of the underlying rules."""
+        futures = [_launch(rule, market, format='PSEUDO_NUMERIC') for rule in self.rules]
+        for f_rule in as_completed(futures):
+            if f_rule.result() == "CANCEL":
+                cancel_all(futures)
+                return "CANCEL"
+        # combine in the rules' own order, so rounding doesn't depend on which child happened to finish first
         ret: float = 0
-        futures = [parallel(rule.value, market, format='PSEUDO_NUMERIC') for rule in self.rules]
         for f_rule in futures:
-            val = cast(
-                PseudoNumericResolution,
-                f_rule.result()
-            )
-            if val == "CANCEL":
-                return "CANCEL"
-            ret += val
+            ret += f_rule.result()
         return ret
 
 
@@ -194,23 +225,154 @@ class MultiplicitiveRule(VariadicRule[PseudoNumericResolution]):
 
     def _value(self, market: Market) -> Literal["CANCEL"] | float:
         """Return the product of the underlying rules."""
+        futures = [_launch(rule, market, format='PSEUDO_NUMERIC') for rule in self.rules]
+        for f_rule in as_completed(futures):
+            if f_rule.result() == "CANCEL":
+                cancel_all(futures)
+                return "CANCEL"
+        # combine in the rules' own order, so rounding doesn't depend on which child happened to finish first
         ret: float = 1
-        futures = [parallel(rule.value, market, format='PSEUDO_NUMERIC') for rule in self.rules]
         for f_rule in futures:
-            val = cast(
-                PseudoNumericResolution,
-                f_rule.result()
-            )
-            if val == "CANCEL":
-                return "CANCEL"
-            ret *= val
+            ret *= f_rule.result()
+        return ret
+
+
+@define(slots=False)
+class AnyRule(VariadicRule[Optional[BinaryResolution]]):
+    """Return the OR of many other DoResolveRules."""
+
+    _explainer_stub: ClassVar[str] = "Resolve True if any of the below resolves True, otherwise resolve False"
+    _commutative: ClassVar[bool] = True
+
+    def _value(self, market: Market) -> bool:
+        return any(rule._value(market) for rule in self._evaluation_order())
+
+    def _explain_specific(self, market: Market, indent: int = 0, sig_figs: int = 4) -> str:
+        ret = f"{'  ' * indent}- {self._explainer_stub} (-> {self._value(market)})\n"
+        for rule in self.rules:
+            ret += rule.explain_specific(market, indent + 1, sig_figs)
         return ret
 
 
+@define(slots=False)
+class AllRule(VariadicRule[Optional[BinaryResolution]]):
+    """Return the AND of many other DoResolveRules."""
+
+    _explainer_stub: ClassVar[str] = "Resolve True if all of the below resolve to True, otherwise resolve False"
+    _commutative: ClassVar[bool] = True
+
+    def _value(self, market: Market) -> bool:
+        return all(rule._value(market) for rule in self._evaluation_order())
+
+    def _explain_specific(self, market: Market, indent: int = 0, sig_figs: int = 4) -> str:
+        ret = f"{'  ' * indent}- {self._explainer_stub} (-> {self._value(market)})\n"
+        for rule in self.rules:
+            ret += rule.explain_specific(market, indent + 1, sig_figs)
+        return ret
+
+
+def flatten(rule: Rule[T]) -> Rule[T]:
+    """Rewrite chains of EitherRules and BothRules into single AnyRules and AllRules, throughout a rule tree.
+
+    The result evaluates the same way, but with fewer nested calls. A lone EitherRule or BothRule is left as it is. This
+    is not applied automatically, since it also changes the shape of the explanations given to traders.
+    """
+    if isinstance(rule, (EitherRule, AnyRule)):
+        return cast(Rule[T], _flatten_chain(rule, EitherRule, AnyRule))
+    elif isinstance(rule, (BothRule, AllRule)):
+        return cast(Rule[T], _flatten_chain(rule, BothRule, AllRule))
+    elif isinstance(rule, UnaryRule):
+        return evolve(rule, child=flatten(rule.child))
+    elif isinstance(rule, BinaryRule):
+        return evolve(rule, rule1=flatten(rule.rule1), rule2=flatten(rule.rule2))
+    elif isinstance(rule, VariadicRule):
+        return evolve(rule, rules=[flatten(child) for child in rule.rules])
+    return rule
+
+
+def _flatten_chain(
+    rule: Rule[Any], binary: type[BinaryRule[Any]], variadic: type[VariadicRule[Any]]
+) -> Rule[Any]:
+    if isinstance(rule, binary):
+        children = [flatten(rule.rule1), flatten(rule.rule2)]
+        if not any(isinstance(child, (binary, variadic)) for child in children):
+            return evolve(rule, rule1=children[0], rule2=children[1])
+    else:
+        children = [flatten(child) for child in cast(VariadicRule[Any], rule).rules]
+    ret: list[Rule[Any]] = []
+    for child in children:
+        if isinstance(child, variadic):
+            ret.extend(child.rules)
+        elif isinstance(child, binary):
+            ret.extend((child.rule1, child.rule2))
+        else:
+            ret.append(child)
+    return variadic(ret)
+
+
+#: combinators whose value depends only on their children's values, so they can be worked out ahead of time when all
+#: of those are constants
+_PURE_RULES = (
+    NegateRule, EitherRule, BothRule, NANDRule, NeitherRule, XORRule, XNORRule, ImpliesRule, ConditionalRule,
+    ModulusRule, AdditiveRule, MultiplicitiveRule, AnyRule, AllRule
+)
+#: combinators which one constant child can decide, as (that child's truthiness, the resulting value)
+_DECIDED_BY = {
+    EitherRule: (True, True),
+    AnyRule: (True, True),
+    NeitherRule: (True, False),
+    BothRule: (False, False),
+    AllRule: (False, False),
+    NANDRule: (False, True),
+}
+
+
+def simplify(rule: Rule[T]) -> Rule[T]:
+    """Fold subtrees whose values are already decided by ResolveToValue leaves into a single ResolveToValue.
+
+    The result evaluates the same way, but skips the folded work. Like flatten(), this is not applied automatically,
+    since the folded subtrees no longer appear in the explanations given to traders.
+    """
+    children: Sequence[Rule[Any]]
+    if isinstance(rule, UnaryRule):
+        rule = evolve(rule, child=simplify(rule.child))
+        children = (rule.child, )
+    elif isinstance(rule, BinaryRule):
+        rule = evolve(rule, rule1=simplify(rule.rule1), rule2=simplify(rule.rule2))
+        children = (rule.rule1, rule.rule2)
+    elif isinstance(rule, VariadicRule):
+        rule = evolve(rule, rules=[simplify(child) for child in rule.rules])
+        children = rule.rules
+    else:
+        return rule
+    if type(rule) not in _PURE_RULES:
+        return rule
+    constants = [child.resolve_value for child in children if type(child) is ResolveToValue]
+    if len(constants) == len(children):
+        try:
+            # none of these look at the market, and leaving it out means this can't accidentally make requests
+            return ResolveToValue(rule._value(None))  # type: ignore[arg-type]
+        except Exception:
+            # leave the error to be raised when the rule is actually evaluated
+            return rule
+    decided_by = _DECIDED_BY.get(type(rule))
+    if decided_by is not None and any(bool(value) is decided_by[0] for value in constants):
+        return cast(Rule[T], ResolveToValue(decided_by[1]))
+    if type(rule) is ImpliesRule and (
+        (type(rule.rule1) is ResolveToValue and not rule.rule1.resolve_value)
+        or (type(rule.rule2) is ResolveToValue and rule.rule2.resolve_value)
+    ):
+        # a false premise or a true conclusion decides an implication, whichever side it's on
+        return cast(Rule[T], ResolveToValue(True))
+    return rule
+
+
 @define(slots=False)
 class ResolveRandomIndex(ResolveRandomSeed):
     """Resolve to a random index in a market."""
 
+    _cost: ClassVar[int] = 100
+
     size: Optional[int] = None
     start: int = 0
 
@@ -231,16 +393,22 @@ class ResolveRandomIndex(ResolveRandomSeed):
             method = 'randrange'
         super().__init__(seed, method, *args, **kwargs)
 
+    def __attrs_post_init__(self) -> None:
+        """Drop pool weights that older versions stored on the rule, since they conflict with cum_weights."""
+        super().__attrs_post_init__()
+        self.kwargs.pop("weights", None)
+
     def _value(self, market: Market) -> int:
-        market.refresh()
+        # arguments are passed down rather than stored, so concurrent evaluations can't see each other's pools
         if self.method == 'randrange':
-            self.args = (self.start, self.size)
-        else:
-            assert isinstance(market.market.pool, Mapping)
-            items = [(int(idx), float(obj)) for idx, obj in market.market.pool.items() if int(idx) >= self.start]
-            self.args = (range(self.start, self.start + len(items)), )
-            self.kwargs["weights"] = [prob for _, prob in items]
-        return cast(int, super()._value(market))
+            return cast(int, self._draw((self.start, self.size), self.kwargs))
+        market.refresh()
+        assert isinstance(market.market.pool, Mapping)
+        # choices() would otherwise accumulate the weights again in every round. Doing it once here, the same way it
+        # does, leaves the draws unchanged
+        cum_weights = list(accumulate(float(obj) for idx, obj in market.market.pool.items() if int(idx) >= self.start))
+        args = (range(self.start, self.start + len(cum_weights)), )
+        return cast(int, self._draw(args, {**self.kwargs, "cum_weights": cum_weights}))
 
     def _explain_abstract(self, indent: int = 0, **kwargs: Any) -> str:
         ret = f"{'  ' * indent}- Resolve to a random index, given some original seed. This one operates on a "
@@ -258,11 +426,22 @@ class ResolveMultipleValues(ResolutionValueRule):
     shares: MutableSequence[tuple[ResolutionValueRule, float]] = Factory(list)
 
     def _value(self, market: Market) -> FreeResponseResolution | MultipleChoiceResolution:
-        ret: DefaultDict[int, float] = defaultdict(float)
+        ret: dict[int, float] = {}
+        # submit every share before waiting on any, so slow (e.g. network-bound) rules overlap. A rule that appears in
+        # several shares is only evaluated once, and one whose share is zero not at all
+        pending: dict[int, Future[Any]] = {}
+        futures = []
         for rule, part in self.shares:
-            val = cast(Dict[Union[str, int], Future[float]], parallel(rule.value, market, format='FREE_RESPONSE'))
+            if part == 0:
+                continue
+            if id(rule) not in pending:
+                pending[id(rule)] = _launch(rule, market, format='FREE_RESPONSE')
+            futures.append((pending[id(rule)], part))
+        for f_val, part in futures:
+            val: Mapping[Union[str, int], float] = f_val.result()
             for idx, value in val.items():
-                ret[int(idx)] += value.result() * part
+                key = int(idx)
+                ret[key] = ret.get(key, 0.0) + value * part
         return normalize_mapping(ret)
 
     def _explain_abstract(self, indent: int = 0, **kwargs: Any) -> str:
@@ -280,13 +459,13 @@ class ResolveMultipleValues(ResolutionValueRule):
         shares: MutableSequence[tuple[ResolutionValueRule | tuple[str, ModJSONDict], float]] = (
             env.get('shares', [])  # type: ignore[assignment]
         )
-        new_shares = []
+        new_shares: list[tuple[ResolutionValueRule, float]] = []
         for rule, weight in shares:
-            try:
-                type_, kwargs = cast(Tuple[str, ModJSONDict], rule)
-                new_rule = get_rule(type_).from_dict(kwargs)
-                new_shares.append((new_rule, weight))
-            except Exception:
-                pass
+            # rules that were already built are kept, rather than silently dropped
+            if isinstance(rule, Rule):
+                new_shares.append((rule, weight))
+            else:
+                type_, kwargs = rule
+                new_shares.append((cast(ResolutionValueRule, get_rule(type_).from_dict(kwargs)), weight))
         env_copy['shares'] = new_shares  # type: ignore
         return super().from_dict(env_copy)
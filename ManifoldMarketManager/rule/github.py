@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from os import getenv
+from threading import Lock
+from time import monotonic
 from typing import TYPE_CHECKING, cast
 
 from attrs import define
 from github3 import GitHub
 from github3 import login as gh_login
+from requests.adapters import HTTPAdapter
 
 from ..caching import parallel
 from ..consts import EnvironmentVariable
@@ -17,7 +21,7 @@ from . import DoResolveRule, ResolutionValueRule
 
 if TYPE_CHECKING:  # pragma: no cover
     from concurrent.futures import Future
-    from typing import Any, Optional
+    from typing import Any, ClassVar, Literal, Optional
 
     from github3.issues import Issue
     from github3.pulls import PullRequest
@@ -25,15 +29,52 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..market import Market
 
 
+def _pooled(gh: GitHub) -> GitHub:
+    """Give a GitHub client a connection pool large enough for the worker threads that share it."""
+    gh.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return gh
+
+
+@lru_cache(maxsize=None)
 def unauth_login() -> GitHub:
-    """Return an unauthorized login to GitHub."""
-    return GitHub()
+    """Return an unauthorized login to GitHub.
 
+    The client is shared, so that its HTTP session can keep connections to GitHub alive between calls.
+    """
+    return _pooled(GitHub())
 
+
+@lru_cache(maxsize=None)
 @require_env(EnvironmentVariable.GithubAccessToken, EnvironmentVariable.GithubUsername)
 def login() -> GitHub:
-    """Return an authorized login to GitHub."""
-    return gh_login(username=getenv('GithubUsername'), token=getenv('GithubAccessToken'))
+    """Return an authorized login to GitHub.
+
+    The client is shared, so that its HTTP session can keep connections to GitHub alive between calls.
+    """
+    return _pooled(gh_login(username=getenv('GithubUsername'), token=getenv('GithubAccessToken')))
+
+
+#: How long, in seconds, a fetched issue or pull request is reused before it is fetched again
+LOOKUP_TTL = 60.0
+_lookup_cache: dict[tuple[str, str, str, int], tuple[float, Any]] = {}
+_lookup_lock = Lock()
+
+
+def _cached_lookup(kind: Literal['issue', 'pull_request'], owner: str, repo: str, number: int) -> Any:
+    """Fetch an issue or pull request, sharing the result between every rule that asks within LOOKUP_TTL.
+
+    A stale entry is replaced by a freshly fetched object rather than refreshed in place, since worker threads may
+    still be reading the old one.
+    """
+    key = (kind, owner, repo, number)
+    with _lookup_lock:
+        cached = _lookup_cache.get(key)
+    if cached is not None and monotonic() - cached[0] < LOOKUP_TTL:
+        return cached[1]
+    obj = getattr(login(), kind)(owner, repo, number)
+    with _lookup_lock:
+        _lookup_cache[key] = (monotonic(), obj)
+    return obj
 
 
 @define(slots=False)
@@ -46,17 +87,19 @@ class GitHubIssueMixin:
 
     def f_issue(self) -> Future[Issue]:
         """Return a Future object which resolves to the relevant Issue object."""
-        return parallel(login().issue, self.owner, self.repo, self.number)
+        return parallel(_cached_lookup, 'issue', self.owner, self.repo, self.number)
 
     def f_pr(self) -> Future[PullRequest]:
         """Return a Future object which resolves to the relevant PullRequest object."""
-        return parallel(login().pull_request, self.owner, self.repo, self.number)
+        return parallel(_cached_lookup, 'pull_request', self.owner, self.repo, self.number)
 
 
 @define(slots=False)
 class ResolveWithPR(DoResolveRule, GitHubIssueMixin):
     """Return True if the specified PR was merged in the past."""
 
+    _cost: ClassVar[int] = 100
+
     @require_env(EnvironmentVariable.GithubAccessToken, EnvironmentVariable.GithubUsername)
     def _value(self, market: Market) -> bool:
         """Return True if the issue is closed or the PR is merged, otherwise False."""
@@ -88,6 +131,8 @@ class ResolveWithPR(DoResolveRule, GitHubIssueMixin):
 class ResolveToPR(ResolutionValueRule, GitHubIssueMixin):
     """Resolve to True if the PR is merged, otherwise False."""
 
+    _cost: ClassVar[int] = 100
+
     def _value(self, market: Market) -> bool:
         pr = self.f_pr().result()
         return pr is not None and pr.merged
@@ -113,13 +158,20 @@ class ResolveToPR(ResolutionValueRule, GitHubIssueMixin):
 class ResolveToPRDelta(ResolutionValueRule, GitHubIssueMixin):
     """Resolve to the fractional number of days between start and merged date or, if not merged, MAX."""
 
+    _cost: ClassVar[int] = 100
+
     start: datetime
 
+    def __attrs_post_init__(self) -> None:
+        """Pin the start time to UTC once, rather than on every comparison with GitHub's timestamps."""
+        super().__attrs_post_init__()
+        self._start_utc = self.start.replace(tzinfo=timezone.utc)
+
     def _value(self, market: Market) -> float:
         pr = self.f_pr().result()
         if pr is None or pr.merged_at is None:
             return cast(float, market.market.max)
-        delta = cast(datetime, pr.merged_at) - self.start.replace(tzinfo=timezone.utc)
+        delta = cast(datetime, pr.merged_at) - self._start_utc
         return delta.days + (delta.seconds / (24 * 60 * 60))
 
     def _explain_abstract(self, indent: int = 0, max_: Optional[float] = None, **kwargs: Any) -> str:
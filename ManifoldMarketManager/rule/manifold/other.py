@@ -17,7 +17,7 @@ from ..abstract import ResolveRandomSeed
 from . import ManifoldMarketMixin
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any
+    from typing import Any, ClassVar
 
     from pymanifold.types import Market as APIMarket
 
@@ -29,6 +29,8 @@ if TYPE_CHECKING:  # pragma: no cover
 class OtherMarketClosed(DoResolveRule, ManifoldMarketMixin):
     """A rule that checks whether another market is closed."""
 
+    _cost: ClassVar[int] = 100
+
     def _value(self, market: Market) -> bool:
         mkt = self.api_market(market=market)
         assert mkt.closeTime is not None
@@ -42,6 +44,8 @@ class OtherMarketClosed(DoResolveRule, ManifoldMarketMixin):
 class OtherMarketResolved(DoResolveRule, ManifoldMarketMixin):
     """A rule that checks whether another market is resolved."""
 
+    _cost: ClassVar[int] = 100
+
     def _value(self, market: Market) -> bool:
         return bool(self.api_market().isResolved)
 
@@ -53,6 +57,8 @@ class OtherMarketResolved(DoResolveRule, ManifoldMarketMixin):
 class OtherMarketUniqueTraders(ManifoldMarketMixin, Rule[int]):
     """A rule that checks whether another market is resolved."""
 
+    _cost: ClassVar[int] = 100
+
     def _value(self, market: Market) -> int:
         return len(
             {bet.userId for bet in self.api_market(market=market).bets} - {None}
@@ -66,13 +72,16 @@ class OtherMarketUniqueTraders(ManifoldMarketMixin, Rule[int]):
 class OtherMarketValue(Rule[T], ManifoldMarketMixin):
     """A rule that resolves to the value of another rule."""
 
+    _cost: ClassVar[int] = 100
+
     def _value(self, market: Market) -> T:
         mkt = self.api_market(market=market)
+        outcome_type = mkt.outcomeType
         if mkt.resolution == "CANCEL":
             ret: AnyResolution = "CANCEL"
-        elif mkt.outcomeType == "BINARY":
+        elif outcome_type == Outcome.BINARY:
             ret = self._binary_value(market, mkt) * 100
-        elif mkt.outcomeType == "PSEUDO_NUMERIC":
+        elif outcome_type == Outcome.PSEUDO_NUMERIC:
             ret = prob_to_number_cpmm1(
                 self._binary_value(market, mkt),
                 float(mkt.min or 0),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from heapq import nlargest
+from operator import itemgetter
 from typing import TYPE_CHECKING, Mapping, Union, cast
 
 from attrs import Factory, define
@@ -63,6 +65,8 @@ class UniqueTradersRule(ThisToOtherConverter, OtherMarketUniqueTraders):
 class FibonacciValueRule(Rule[Union[float, Mapping[int, float]]]):
     """Resolve each value with a fibonacci weight, ranked by probability."""
 
+    _cost: ClassVar[int] = 100
+
     exclude: set[int] = Factory(set)
     min_rewarded: float = 0.0001
 
@@ -88,11 +92,13 @@ class RoundValueRule(CurrentValueRule[Union[BinaryResolution, PseudoNumericResol
     _explainer_stub: ClassVar[str] = "Resolves to round(MKT)"
 
     def _value(self, market: Market) -> float:
-        if market.market.outcomeType in Outcome.MC_LIKE():
+        api_market = market.market
+        outcome_type = api_market.outcomeType
+        if outcome_type == Outcome.BINARY:
+            assert api_market.probability
+            return bool(round(api_market.probability))
+        elif outcome_type in Outcome.MC_LIKE():
             raise RuntimeError()
-        elif market.market.outcomeType == Outcome.BINARY:
-            assert market.market.probability
-            return bool(round(market.market.probability))
         return round(cast(float, super()._value(market)))
 
 
@@ -100,22 +106,14 @@ class RoundValueRule(CurrentValueRule[Union[BinaryResolution, PseudoNumericResol
 class PopularValueRule(Rule[Union[MultipleChoiceResolution, FreeResponseResolution]]):
     """Resolve to the n most likely market-consensus values, weighted by their probability."""
 
+    _cost: ClassVar[int] = 100
+
     size: int = 1
 
     def _value(self, market: Market) -> FreeResponseResolution | MultipleChoiceResolution:
         market.refresh()
         answers = market_to_answer_map(market)
-        final_answers: dict[int, float] = {}
-        try:
-            for _ in range(self.size):
-                next_answer = max(answers, key=answers.__getitem__)
-                final_answers[next_answer] = answers[next_answer]
-                del answers[next_answer]
-        except ValueError as e:
-
-            if "arg is an empty sequence" not in e.args[0]:
-                raise
-        return normalize_mapping(final_answers)
+        return normalize_mapping(dict(nlargest(self.size, answers.items(), key=itemgetter(1))))
 
     def _explain_abstract(self, indent: int = 0, **kwargs: Any) -> str:
         return f"{'  ' * indent}- Resolves to the {self.size} most probable answers, weighted by their probability.\n"
@@ -20,6 +20,8 @@ if TYPE_CHECKING:  # pragma: no cover
 class ManifoldUserRule(Rule[float]):
     """Include information about what user feature you'd like to query."""
 
+    _cost: ClassVar[int] = 100
+
     user: str
     field: Literal["allTime", "daily", "weekly", "monthly"] = "allTime"
     attr: ClassVar[str] = ""
@@ -27,6 +29,7 @@ class ManifoldUserRule(Rule[float]):
 
     def __init_subclass__(cls) -> None:
         """Enforce that subclasses provide an explanatory stub."""
+        super().__init_subclass__()
         assert cls.attr
         assert cls.attr_desc
 
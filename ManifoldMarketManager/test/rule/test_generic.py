@@ -1,26 +1,34 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from datetime import datetime, timedelta, timezone
 from itertools import chain, product
-from typing import TYPE_CHECKING, Callable, List, Type, cast
+from pickle import dumps, loads
+from threading import Event
+from typing import TYPE_CHECKING, Callable, List, Optional, Type, cast
 
-from pytest import fixture, mark
+from attrs import define, field
+from pytest import MonkeyPatch, fixture, mark
 
-from ... import Rule
-from ...consts import BinaryResolution
+from ... import Rule, caching
+from ...caching import evaluation_scope
+from ...consts import BinaryResolution, PseudoNumericResolution, T
 from ...market import Market
 from ...rule import get_rule
 from ...rule.abstract import BinaryRule, VariadicRule
-from ...rule.generic import AdditiveRule, ModulusRule, MultiplicitiveRule, NegateRule, ResolveAtTime, ResolveToValue
+from ...rule.generic import (AdditiveRule, AllRule, AnyRule, BothRule, EitherRule, ImpliesRule, ModulusRule,
+                             MultiplicitiveRule, NANDRule, NegateRule, NeitherRule, ResolveAtTime,
+                             ResolveMultipleValues, ResolveToValue, flatten, simplify)
 from ...util import fibonacci
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Literal, Optional
+    from typing import Any, ClassVar, Literal
 
     from pytest_regressions.data_regression import DataRegressionFixture
 
-    from ...consts import AnyResolution, PseudoNumericResolution, T
+    from ...consts import AnyResolution
+    from ...util import ModJSONDict
     from .. import PytestRequest
 
 Validator = Callable[[BinaryResolution, BinaryResolution], BinaryResolution]
@@ -84,6 +92,136 @@ def test_negate_rule_value() -> None:
     })._value(mkt) is False
 
 
+@define(slots=False)
+class CountedValue(ResolveToValue[T]):
+    """A ResolveToValue which records each time it is evaluated."""
+
+    calls: list[Market] = field(factory=list, repr=False, eq=False)
+
+    def _value(self, market: Market) -> T:
+        self.calls.append(market)
+        return super()._value(market)
+
+
+@define(slots=False)
+class ExpensiveValue(CountedValue[T]):
+    """A CountedValue which is costed like a network request."""
+
+    _cost: ClassVar[int] = 100
+
+
+def test_cheaper_child_first() -> None:
+    mkt: Market = None  # type: ignore[assignment]
+    for binary, decider in ((EitherRule, True), (BothRule, False), (NANDRule, False), (NeitherRule, True)):
+        expensive = ExpensiveValue(not decider)
+        rule = binary(
+            cast(Rule[Optional[BinaryResolution]], expensive),
+            cast(Rule[Optional[BinaryResolution]], ResolveToValue(decider))
+        )
+        assert rule.cost() == 101
+        rule.value(mkt)
+        assert not expensive.calls
+        # the written order is kept for explanations
+        assert rule.rule1 is expensive
+
+    # order matters for implication, so the expensive premise is still evaluated first
+    expensive = ExpensiveValue(False)
+    ImpliesRule(cast(Rule[Optional[BinaryResolution]], expensive), ResolveToValue(True)).value(mkt)
+    assert expensive.calls
+
+
+def test_any_all_rule() -> None:
+    mkt: Market = None  # type: ignore[assignment]
+    for vals in product(cast(List[Optional[bool]], [True, False, None]), repeat=3):
+        rules = [cast(Rule[Optional[BinaryResolution]], ResolveToValue(val)) for val in vals]
+        for obj, expected in ((AnyRule(rules), any(vals)), (AllRule(rules), all(vals))):
+            assert obj.value(mkt) is expected
+
+    # the expensive child is written first, but the cheap one decides the result on its own
+    for variadic, decider in ((AnyRule, True), (AllRule, False)):
+        expensive = ExpensiveValue(not decider)
+        rule = variadic([cast(Rule[Optional[BinaryResolution]], rule) for rule in (expensive, ResolveToValue(decider))])
+        assert rule.value(mkt) is decider
+        assert not expensive.calls
+
+
+def test_flatten() -> None:
+    mkt: Market = None  # type: ignore[assignment]
+    a, b, c, d = (cast(Rule[Optional[BinaryResolution]], ResolveToValue(val)) for val in (False, True, False, True))
+    flat = flatten(EitherRule(EitherRule(a, b), EitherRule(c, BothRule(BothRule(b, d), a))))
+    assert isinstance(flat, AnyRule)
+    assert flat.rules[:3] == [a, b, c]
+    assert isinstance(flat.rules[3], AllRule)
+    assert flat.rules[3].rules == [b, d, a]
+    assert flat.value(mkt) is True
+
+    negated = flatten(NegateRule(BothRule(BothRule(a, b), c)))
+    assert isinstance(negated, NegateRule)
+    assert isinstance(negated.child, AllRule)
+    assert negated.value(mkt) is True
+
+    # without a chain there is nothing to flatten, so the rules are kept as written
+    single = flatten(EitherRule(a, BothRule(b, c)))
+    assert type(single) is EitherRule
+    assert type(single.rule2) is BothRule
+    assert (single.rule1, single.rule2.rule1, single.rule2.rule2) == (a, b, c)
+
+
+def test_simplify() -> None:
+    mkt: Market = None  # type: ignore[assignment]
+    unknown = cast(Rule[Optional[BinaryResolution]], ResolveAtTime(datetime(2000, 1, 1)))
+    yes, no = (cast(Rule[Optional[BinaryResolution]], ResolveToValue(val)) for val in (True, False))
+    folded = simplify(EitherRule(NegateRule(no), BothRule(yes, no)))
+    assert type(folded) is ResolveToValue
+    assert folded.resolve_value is True
+
+    decided = simplify(BothRule(unknown, no))
+    assert type(decided) is ResolveToValue
+    assert decided.resolve_value is False
+
+    for implication in (ImpliesRule(no, unknown), ImpliesRule(unknown, yes)):
+        decided = simplify(implication)
+        assert type(decided) is ResolveToValue
+        assert decided.resolve_value is True
+    assert isinstance(simplify(ImpliesRule(yes, unknown)), ImpliesRule)
+
+    undecided = simplify(BothRule(unknown, NegateRule(no)))
+    assert isinstance(undecided, BothRule)
+    assert {type(undecided.rule1), type(undecided.rule2)} == {ResolveAtTime, ResolveToValue}
+    assert undecided.value(mkt) is True
+
+    summed = simplify(AdditiveRule([ResolveToValue(1), MultiplicitiveRule([ResolveToValue(2), ResolveToValue(3)])]))
+    assert type(summed) is ResolveToValue
+    assert summed.resolve_value == 7
+
+    # errors are left to be raised when the rule is actually evaluated
+    assert isinstance(simplify(ModulusRule(ResolveToValue(1), ResolveToValue(0))), ModulusRule)
+
+
+def test_shared_rule_evaluated_once() -> None:
+    calls: list[Market] = []
+
+    @define(slots=False)
+    class CountedValue(ResolveToValue[bool]):
+        def _value(self, market: Market) -> bool:
+            calls.append(market)
+            return super()._value(market)
+
+    mkt: Market = None  # type: ignore[assignment]
+    shared = cast(Rule[Optional[BinaryResolution]], CountedValue(True))
+    rule = BothRule(shared, EitherRule(shared, ResolveToValue(False)))
+    assert rule._value(mkt) is True
+    assert len(calls) == 2
+
+    assert rule.value(mkt) is True
+    assert len(calls) == 3
+
+    with evaluation_scope():
+        assert rule.value(mkt) is True
+        assert rule.value(mkt) is True
+    assert len(calls) == 4
+
+
 def test_at_time_rule_value() -> None:
     now = datetime.now()
     utcnow = datetime.now(timezone.utc)
@@ -97,6 +235,8 @@ def test_at_time_rule_value() -> None:
     for idx, val in enumerate(values):
         obj = ResolveAtTime(val)
         assert bool(obj.value(cast(Market, None))) is bool(idx % 2)
+        # rules are stored pickled, so derived state must survive the round trip
+        assert bool(loads(dumps(obj)).value(cast(Market, None))) is bool(idx % 2)
 
 
 @mark.depends(on=('ManifoldMarketManager/test/test_util.py::test_fib', ))
@@ -144,3 +284,56 @@ def test_variadic_rule(
         prev_desc = desc
         data[x] = rule.value(mkt, refresh=True)
     data_regression.check({'answer': data})
+
+
+def test_variadic_rule_cancel(
+    VariadicRuleSubclass: Type[VariadicRule[PseudoNumericResolution]], monkeypatch: MonkeyPatch
+) -> None:
+    mkt: Market = None  # type: ignore[assignment]
+    # cheap children are deferred and run in order, so nothing after a "CANCEL" is evaluated
+    later: CountedValue[float] = CountedValue(2.0)
+    rule = VariadicRuleSubclass([ResolveToValue("CANCEL"), cast(Rule[PseudoNumericResolution], later)])
+    assert rule.value(mkt) == "CANCEL"
+    assert not later.calls
+
+    # expensive children go to the thread pool, and the ones still waiting there are cancelled
+    gate = Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        monkeypatch.setattr(caching, 'CACHE', True)
+        monkeypatch.setattr(caching, 'executor', pool, raising=False)
+        pool.submit(gate.wait)  # keep the only worker busy, so the expensive child can't start yet
+        pending: ExpensiveValue[float] = ExpensiveValue(2.0)
+        rule = VariadicRuleSubclass([cast(Rule[PseudoNumericResolution], pending), ResolveToValue("CANCEL")])
+        try:
+            assert rule.value(mkt) == "CANCEL"
+        finally:
+            gate.set()
+    assert not pending.calls
+
+
+def test_multiple_values_rule() -> None:
+    mkt: Market = None  # type: ignore[assignment]
+    shares: list[tuple[Any, float]] = [
+        (ResolveToValue({1: 1}), 1),
+        (ResolveToValue({2: 1, "3": 1}), 2),
+    ]
+    rule = ResolveMultipleValues(shares)
+    # each share's answers are normalized before being weighted, so {2, 3} split the second share's weight
+    assert rule.value(mkt, format='FREE_RESPONSE') == {1: 1 / 3, 2: 1 / 3, 3: 1 / 3}
+
+    # a rule shared between several shares still contributes each of its weights
+    one = ResolveToValue({1: 1})
+    shares = [(one, 1), (one, 1), (ResolveToValue({2: 1}), 2)]
+    rule = ResolveMultipleValues(shares)
+    assert rule.value(mkt, format='FREE_RESPONSE') == {1: 0.5, 2: 0.5}
+
+    # zero-weight shares are never evaluated, so they can't contribute answers or cancel
+    shares = [(one, 1), (ResolveToValue("CANCEL"), 0)]
+    rule = ResolveMultipleValues(shares)
+    assert rule.value(mkt, format='FREE_RESPONSE') == {1: 1}
+
+    rule = ResolveMultipleValues.from_dict(cast("ModJSONDict", {"shares": [
+        (["generic.ResolveToValue", {"resolve_value": {1: 1}}], 1),
+        (ResolveToValue({2: 1}), 1),
+    ]}))
+    assert rule.value(mkt, format='FREE_RESPONSE') == {1: 0.5, 2: 0.5}
@@ -3,10 +3,11 @@ from __future__ import annotations
 from argparse import Namespace
 from typing import TYPE_CHECKING
 
-from pytest import fixture
+from pytest import MonkeyPatch, fixture
 
 from ...market import Market
-from ...rule.github import ResolveToPR, ResolveToPRDelta, ResolveWithPR, login, unauth_login
+from ...rule import github
+from ...rule.github import ResolveToPR, ResolveToPRDelta, ResolveWithPR, _cached_lookup, login, unauth_login
 from .. import manifold_vcr
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -26,6 +27,14 @@ issues = [
 ]
 
 
+@fixture(autouse=True)  # type: ignore
+def clear_github_caches() -> None:
+    """Make sure clients and lookups from one cassette are never reused under another."""
+    login.cache_clear()
+    unauth_login.cache_clear()
+    github._lookup_cache.clear()
+
+
 @fixture(params=issues, ids=["%s - %s - %d" % tup for tup in issues])  # type: ignore
 def pr_tup(request: PytestRequest[tuple[str, str, int]]) -> tuple[str, str, int]:
     """Generate markets via a fixture."""
@@ -84,3 +93,30 @@ def test_ResolveToPRDelta(
         desc = obj.explain_abstract(max_=1000)
         for arg in pr_tup:
             assert str(arg) in desc
+
+
+def test_cached_lookup(monkeypatch: MonkeyPatch) -> None:
+    """Make sure lookups are shared until LOOKUP_TTL passes, and are then replaced by a freshly fetched object."""
+    now = 0.0
+    fetched: list[object] = []
+
+    def issue(owner: str, repo: str, number: int) -> object:
+        fetched.append(Namespace(owner=owner, repo=repo, number=number))
+        return fetched[-1]
+
+    monkeypatch.setattr(github, 'login', lambda: Namespace(issue=issue))
+    monkeypatch.setattr(github, 'monotonic', lambda: now)
+    monkeypatch.setattr(github, 'LOOKUP_TTL', 10.0)
+
+    first = _cached_lookup('issue', 'owner', 'repo', 1)
+    now = 9.0
+    assert _cached_lookup('issue', 'owner', 'repo', 1) is first
+    assert _cached_lookup('issue', 'owner', 'repo', 2) is not first
+    assert len(fetched) == 2
+
+    now = 10.0
+    second = _cached_lookup('issue', 'owner', 'repo', 1)
+    # anyone still holding the old object never sees it change underneath them
+    assert second is not first
+    assert vars(first) == vars(second)
+    assert len(fetched) == 3
@@ -56,3 +56,10 @@ def test_from_id(mkt: Market) -> None:
     with manifold_vcr.use_cassette(f'test_market/fetch_by_id/{quote(mkt.id)}.yaml'):
         mkt2 = Market.from_id(mkt.id)
     assert_equality(mkt, mkt2)
+
+
+def test_from_ids(mkt: Market) -> None:
+    """Make sure Markets can be grabbed in bulk by ID."""
+    with manifold_vcr.use_cassette(f'test_market/fetch_by_id/{quote(mkt.id)}.yaml'):
+        (mkt2, ) = Market.from_ids([mkt.id])
+    assert_equality(mkt, mkt2)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from pickle import dumps, loads
 from typing import TYPE_CHECKING, Mapping
 
-from pytest import fixture, mark, raises, skip
+from pytest import MonkeyPatch, fixture, mark, raises, skip, warns
 
 from .. import Rule
 from ..consts import AVAILABLE_RULES, Outcome
@@ -74,3 +75,29 @@ def test_rule_from_dict(rule_name: str) -> None:
     except Exception:
         skip("Cannot instantiate with default arguments, may be tested elsewhere")
     RuleSubclass.from_dict({})
+
+
+def test_plugin_missing_dependency(monkeypatch: MonkeyPatch) -> None:
+    """Make sure a plugin with missing dependencies is skipped with a warning, rather than breaking the package."""
+    from .. import rule
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise ImportError("missing optional dependency")
+
+    # load these for real first, so that monkeypatch puts them back afterwards
+    assert rule.github and rule.__all__
+    monkeypatch.setattr(rule, '_unavailable', set())
+    monkeypatch.setattr(rule, 'import_module', fail)
+    monkeypatch.delattr(rule, 'github')
+    monkeypatch.delattr(rule, '__all__')
+    with warns(UserWarning, match="github"):
+        assert not hasattr(rule, 'github')
+    assert 'github' not in dir(rule)
+    assert rule.__all__ == ['get_rule', 'DoResolveRule', 'ResolutionValueRule']
+
+
+def test_rule_logger_is_shared() -> None:
+    """Make sure building or unpickling a rule doesn't register a new logger for it."""
+    rule = ResolveToValue(1)
+    assert loads(dumps(rule)).logger is rule.logger is Rule.logger
+    assert 'logger' not in vars(rule)
@@ -171,7 +171,12 @@ def explain_abstract(time_rules: Iterable[Rule[Any]], value_rules: Iterable[Rule
 def dynamic_import(fname: str, mname: str, __all__: MutableSequence[str], exempt: Collection[str]) -> None:
     """Dynamically import submodules and add them to the export list."""
     for entry in Path(fname).parent.glob("[!.]*"):
-        name = entry.name.rstrip(".py")
+        if entry.is_dir():
+            name = entry.name
+        elif entry.suffix == ".py":
+            name = entry.stem
+        else:
+            continue
         if name in exempt:
             continue
         try: